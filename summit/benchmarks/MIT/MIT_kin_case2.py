@@ -3,7 +3,6 @@ from summit.experiment import Experiment
 from summit.domain import *
 from summit.utils.dataset import DataSet
 import numpy as np
-from scipy.integrate import solve_ivp
 
 
 class MIT_case2(Experiment):
@@ -29,8 +28,9 @@ class MIT_case2(Experiment):
     Notes
     -----
 
-    This benchmark relies on the kinetics simulated by Jensen et al. The mechanistic
-    model is integrated using scipy to find outlet concentrations of all species.
+    This benchmark relies on the kinetics simulated by Jensen et al. There are no
+    side reactions in this case, so the outlet concentrations of all species are
+    calculated with the analytical solution of the mechanistic model.
 
 
     References
@@ -87,7 +87,7 @@ class MIT_case2(Experiment):
         t = float(conditions["t"])
         cat_index = int(conditions["cat_index"])
         T = float(conditions["temperature"])
-        y, res = self._integrate_equations(conc_cat, t, cat_index, T)
+        y, C_final = self._integrate_equations(conc_cat, t, cat_index, T)
         conditions[("y", "DATA")] = y
         return conditions, {}
 
@@ -98,9 +98,17 @@ class MIT_case2(Experiment):
         self.C_i[1] = 0.250  # Initial conc of B
         self.C_i[2] = conc_cat  # Initial conc of cat
 
-        # Integrate
-        res = solve_ivp(self._integrand, [0, t], self.C_i, args=(cat_index, T))
-        C_final = res.y[:, -1]
+        # Without side reactions and with a constant catalyst concentration,
+        # A + B -> R is second order with a closed form solution for the
+        # extent of reaction x: dx/dt = k_R (A_0 - x) (B_0 - x)
+        k_R = self._rate_constant(conc_cat, cat_index, T)
+        A_0, B_0 = self.C_i[0], self.C_i[1]
+        decay = np.exp(-(B_0 - A_0) * k_R * t)
+        x = A_0 * B_0 * (1 - decay) / (B_0 - A_0 * decay)
+        C_final = self.C_i.copy()
+        C_final[0] -= x
+        C_final[1] -= x
+        C_final[3] = x
 
         # Add measurment noise
         C_final += (
@@ -113,17 +121,15 @@ class MIT_case2(Experiment):
         # calculate yield
         # M = [159.09, 71.12, 210.21, 210.21, 261.33]  # molecular weights (g/mol)
         y = C_final[3] / self.C_i[0]
-        return y, res
+        return y, C_final
 
-    def _integrand(self, t, C, cat_index, T):
+    def _rate_constant(self, conc_cat, cat_index, T):
+        """Rate constant of A + B -> R at temperature T in deg C"""
         # Kinetic Constants
         R = 8.314 / 1000  # kJ/K/mol
         T_ref = 90 + 273.71  # Convert to deg K
         T = T + 273.71  # Convert to deg K
-        conc_cat = C[2]
         A_R = 3.1 * 10 ** 7
-        A_S1 = 1 * 10 ** 12
-        A_S2 = 3.1 * 10 ** 5
 
         E_Ai = [0, 0, 0.3, 0.7, 0.7, 2.2, 3.8, 7.3]
         # cat_index = 1
@@ -134,9 +140,12 @@ class MIT_case2(Experiment):
             * A
             * np.exp(-(E_A + E_Ai) / (R * temp))
         )
-        k_R = k(conc_cat, A_R, E_AR, E_Ai[cat_index], T)
-        k_S1 = 0  # k(conc_cat, A_S1, 100, 0 , T)
-        k_S2 = 0  # k(conc_cat, A_S2, 50, 0,  T)
+        return k(conc_cat, A_R, E_AR, E_Ai[cat_index], T)
+
+    def _integrand(self, t, C, cat_index, T):
+        k_R = self._rate_constant(C[2], cat_index, T)
+        k_S1 = 0  # k(conc_cat, 1e12, 100, 0 , T)
+        k_S2 = 0  # k(conc_cat, 3.1e5, 50, 0,  T)
 
         # Reaction Rates
         r = np.zeros(6)
@@ -55,6 +55,7 @@ from copy import deepcopy
 from itertools import product
 from collections import defaultdict
 from copy import deepcopy
+from functools import lru_cache
 import pkg_resources
 import time
 import json
@@ -162,19 +163,15 @@ class ExperimentalEmulator(Experiment):
 
     def _run(self, conditions, **kwargs):
         input_columns = [v.name for v in self.domain.input_variables]
-        X = conditions[input_columns].to_numpy()
-        if X.shape[0] == len(input_columns):
-            X = X[np.newaxis, :]
+        # A single condition (Series) becomes one row; a DataSet is already 2D
+        X = np.atleast_2d(conditions[input_columns].to_numpy())
         X = pd.DataFrame(X, columns=input_columns)
         y_pred, y_pred_std = self._predict(X)
+        if type(conditions) == pd.Series:
+            y_pred, y_pred_std = y_pred[0], y_pred_std[0]
         return_std = kwargs.get("return_std", False)
-        for i, name in enumerate(self.output_variable_names):
-            if type(conditions) == pd.Series:
-                y = y_pred[0, i]
-                y_std = y_pred_std[0, i]
-            else:
-                y = y_pred[:, i]
-                y_std = y_pred_std[:, i]
+        outputs = zip(self.output_variable_names, y_pred.T, y_pred_std.T)
+        for name, y, y_std in outputs:
             conditions.at[(name, "DATA")] = y
             if return_std:
                 conditions.at[(f"{name}_std", "METADATA")] = y_std
@@ -1485,6 +1482,33 @@ def get_model_path():
     return pathlib.Path(pkg_resources.resource_filename("summit", "benchmarks/models"))
 
 
+@lru_cache(maxsize=None)
+def _read_pretrained_dataset(model_name):
+    """Parse a packaged training dataset once per process
+
+    Benchmark campaigns construct the pretrained emulators again for every
+    repeat, so the CSV parsing is shared. Callers get a copy they can mutate.
+
+    """
+    return DataSet.read_csv(get_data_path() / f"{model_name}.csv")
+
+
+def get_pretrained_dataset(model_name):
+    """Get a copy of the packaged training data for a pretrained emulator
+
+    Parameters
+    ----------
+    model_name : str
+        Name of the dataset in summit/benchmarks/data without the extension.
+
+    Returns
+    -------
+    ds : DataSet
+
+    """
+    return _read_pretrained_dataset(model_name).copy()
+
+
 def get_pretrained_reizman_suzuki_emulator(case=1):
     """Get the pretrained Reziman Suzuki Emulator
 
@@ -1516,8 +1540,7 @@ def get_pretrained_reizman_suzuki_emulator(case=1):
     model_path = get_model_path() / model_name
     if not model_path.exists():
         raise NotADirectoryError("Could not initialize from expected path.")
-    data_path = get_data_path()
-    ds = DataSet.read_csv(data_path / f"{model_name}.csv")
+    ds = get_pretrained_dataset(model_name)
     return ReizmanSuzukiEmulator.load(model_path, case=case, dataset=ds)
 
 
@@ -1557,8 +1580,7 @@ class ReizmanSuzukiEmulator(ExperimentalEmulator):
         # Initialization
         model_name = kwargs.get("model_name", f"reizman_suzuki_case_{case}")
         domain = kwargs.pop("domain", self.setup_domain())
-        data_path = get_data_path()
-        ds = DataSet.read_csv(data_path / f"{model_name}.csv")
+        ds = get_pretrained_dataset(model_name)
         if "dataset" in kwargs.keys():
             kwargs.pop("dataset")
         if "model_name" in kwargs.keys():
@@ -1672,8 +1694,7 @@ def get_pretrained_baumgartner_cc_emulator(include_cost=False, use_descriptors=F
 
     """
     model_name = "baumgartner_aniline_cn_crosscoupling"
-    data_path = get_data_path()
-    ds = DataSet.read_csv(data_path / f"{model_name}.csv")
+    ds = get_pretrained_dataset(model_name)
     model_name += "_descriptors" if use_descriptors else ""
     model_path = get_model_path() / model_name
     if not model_path.exists():
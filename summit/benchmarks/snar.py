@@ -3,7 +3,8 @@ from summit.experiment import Experiment
 from summit.domain import *
 from summit.utils.dataset import DataSet
 import numpy as np
-from scipy.integrate import solve_ivp
+from numba import njit, prange
+import time
 
 
 class SnarBenchmark(Experiment):
@@ -35,8 +36,9 @@ class SnarBenchmark(Experiment):
     -----
 
     This benchmark relies on the kinetics observerd by [Hone]_ et al. The mechanistic
-    model is integrated using scipy to find outlet concentrations of all species. These
-    concentrations are then used to calculate STY and E-factor.
+    model is integrated using an adaptive Runge-Kutta method (compiled with numba) to find
+    outlet concentrations of all species. These concentrations are then used to calculate
+    STY and E-factor.
 
     References
     ----------
@@ -105,6 +107,34 @@ class SnarBenchmark(Experiment):
         conditions[("e_factor", "DATA")] = e_factor
         return conditions, {}
 
+    def _run_batch(self, conditions, **kwargs):
+        # Integrate all conditions at once and then post-process row by row
+        start = time.time()
+        tau = conditions["tau"].to_numpy(dtype=float).ravel()
+        equiv_pldn = conditions["equiv_pldn"].to_numpy(dtype=float).ravel()
+        conc_dfnb = conditions["conc_dfnb"].to_numpy(dtype=float).ravel()
+        T = conditions["temperature"].to_numpy(dtype=float).ravel()
+        n = len(tau)
+        C_i = np.zeros((n, 5))
+        C_i[:, 0] = conc_dfnb
+        C_i[:, 1] = equiv_pldn * conc_dfnb
+        C_final = _integrate_snar_batch(C_i, T, tau)
+        integration_time = (time.time() - start) / max(n, 1)
+
+        results, extras, experiment_times = [], [], []
+        for i in range(n):
+            start = time.time()
+            condition = conditions.iloc[i].copy()
+            y, e_factor, res = self._integrate_equations(
+                tau[i], equiv_pldn[i], conc_dfnb[i], T[i], C_final=C_final[i]
+            )
+            condition[("sty", "DATA")] = y
+            condition[("e_factor", "DATA")] = e_factor
+            results.append(condition)
+            extras.append({})
+            experiment_times.append(integration_time + time.time() - start)
+        return results, extras, experiment_times
+
     def _integrate_equations(self, tau, equiv_pldn, conc_dfnb, temperature, **kwargs):
         # Initial Concentrations in mM
         self.C_i = np.zeros(5)
@@ -120,9 +150,10 @@ class SnarBenchmark(Experiment):
         q_2 = self.C_i[1] / C2_0 * q_tot  # flowrate of 2 (pldn)
         q_eth = q_tot - q_1 - q_2  # flowrate of ethanol
 
-        # Integrate
-        res = solve_ivp(self._integrand, [0, tau], self.C_i, args=(temperature,))
-        C_final = res.y[:, -1]
+        # Integrate, unless the outlet concentrations were already calculated
+        C_final = kwargs.get("C_final")
+        if C_final is None:
+            C_final = _integrate_snar(self.C_i, temperature, tau)
 
         # Add measurment noise
         C_final += (
@@ -150,35 +181,158 @@ class SnarBenchmark(Experiment):
         return sty, e_factor, {}
 
     def _integrand(self, t, C, T):
-        # Kinetic Constants
-        R = 8.314 / 1000  # kJ/K/mol
-        T_ref = 90 + 273.71  # Convert to deg K
-        T = T + 273.71  # Convert to deg K
-        # Need to convert from 10^-2 M^-1s^-1 to M^-1min^-1
-        k = (
-            lambda k_ref, E_a, temp: 0.6
-            * k_ref
-            * np.exp(-E_a / R * (1 / temp - 1 / T_ref))
-        )
-        k_a = k(57.9, 33.3, T)
-        k_b = k(2.70, 35.3, T)
-        k_c = k(0.865, 38.9, T)
-        k_d = k(1.63, 44.8, T)
-
-        # Reaction Rates
-        r = np.zeros(5)
-        for i in [0, 1]:  # Set to reactants when close
-            C[i] = 0 if C[i] < 1e-6 * self.C_i[i] else C[i]
-        r[0] = -(k_a + k_b) * C[0] * C[1]
-        r[1] = -(k_a + k_b) * C[0] * C[1] - k_c * C[1] * C[2] - k_d * C[1] * C[3]
-        r[2] = k_a * C[0] * C[1] - k_c * C[1] * C[2]
-        r[3] = k_b * C[0] * C[1] - k_d * C[1] * C[3]
-        r[4] = k_c * C[1] * C[2] + k_d * C[1] * C[3]
-
-        # Deltas
-        dcdtau = r
-        return dcdtau
+        return _snar_rate(t, C, T, self.C_i)
 
     def to_dict(self, **kwargs):
         experiment_params = dict(noise_level=self.noise_level)
         return super().to_dict(**experiment_params)
+
+
+@njit(cache=True)
+def _snar_rate(t, C, T, C_i):
+    """Right-hand side of the SnAr kinetic model"""
+    return _snar_kinetics(C, _snar_rate_constants(T), C_i)
+
+
+@njit(cache=True)
+def _snar_rate_constants(T):
+    """Rate constants of the SnAr reactions at temperature T in deg C"""
+    # Kinetic Constants
+    R = 8.314 / 1000  # kJ/K/mol
+    T_ref = 90 + 273.71  # Convert to deg K
+    T = T + 273.71  # Convert to deg K
+    # Need to convert from 10^-2 M^-1s^-1 to M^-1min^-1
+    k = lambda k_ref, E_a, temp: 0.6 * k_ref * np.exp(-E_a / R * (1 / temp - 1 / T_ref))
+    return np.array(
+        [k(57.9, 33.3, T), k(2.70, 35.3, T), k(0.865, 38.9, T), k(1.63, 44.8, T)]
+    )
+
+
+@njit(cache=True)
+def _snar_kinetics(C, k, C_i):
+    """Reaction rates of the SnAr kinetic model for precomputed rate constants"""
+    k_a, k_b, k_c, k_d = k[0], k[1], k[2], k[3]
+
+    # Reaction Rates
+    r = np.zeros(5)
+    for i in range(2):  # Set to reactants when close
+        if C[i] < 1e-6 * C_i[i]:
+            C[i] = 0
+    r[0] = -(k_a + k_b) * C[0] * C[1]
+    r[1] = -(k_a + k_b) * C[0] * C[1] - k_c * C[1] * C[2] - k_d * C[1] * C[3]
+    r[2] = k_a * C[0] * C[1] - k_c * C[1] * C[2]
+    r[3] = k_b * C[0] * C[1] - k_d * C[1] * C[3]
+    r[4] = k_c * C[1] * C[2] + k_d * C[1] * C[3]
+
+    # Deltas
+    dcdtau = r
+    return dcdtau
+
+
+# Dormand-Prince coefficients (same tableau as scipy's RK45)
+_DP_C = np.array([0, 1 / 5, 3 / 10, 4 / 5, 8 / 9, 1])
+_DP_A = np.array(
+    [
+        [0, 0, 0, 0, 0],
+        [1 / 5, 0, 0, 0, 0],
+        [3 / 40, 9 / 40, 0, 0, 0],
+        [44 / 45, -56 / 15, 32 / 9, 0, 0],
+        [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729, 0],
+        [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+    ]
+)
+_DP_B = np.array([35 / 384, 0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84])
+_DP_E = np.array(
+    [-71 / 57600, 0, 71 / 16695, -71 / 1920, 17253 / 339200, -22 / 525, 1 / 40]
+)
+
+
+@njit(cache=True)
+def _rms(x):
+    return np.sqrt(np.mean(x ** 2))
+
+
+@njit(cache=True)
+def _integrate_snar(C_i, T, tau, rtol=1e-3, atol=1e-6):
+    """Integrate the SnAr kinetic model from 0 to tau
+
+    Adaptive Dormand-Prince (RK45) integration with the same step size control
+    and default tolerances as scipy's `solve_ivp`. The whole integration runs in
+    compiled code and only the outlet concentrations are returned.
+    """
+    n = C_i.shape[0]
+    t = 0.0
+    y = C_i.copy()
+    # The temperature is constant, so the rate constants are evaluated once
+    k = _snar_rate_constants(T)
+    K = np.zeros((7, n))
+    # Like solve_ivp, the state itself is passed so that the clipping of
+    # depleted reactants in _snar_kinetics carries over into it
+    K[0] = _snar_kinetics(y, k, C_i)
+
+    # Initial step size (Hairer, Norsett & Wanner, p. 169)
+    scale = atol + np.abs(y) * rtol
+    d0 = _rms(y / scale)
+    d1 = _rms(K[0] / scale)
+    h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+    h0 = min(h0, tau)
+    f1 = _snar_kinetics(y + h0 * K[0], k, C_i)
+    d2 = _rms((f1 - K[0]) / scale) / h0
+    if d1 <= 1e-15 and d2 <= 1e-15:
+        h1 = max(1e-6, h0 * 1e-3)
+    else:
+        h1 = (0.01 / max(d1, d2)) ** (1 / 5)
+    h = min(100 * h0, h1, tau)
+
+    while t < tau:
+        h = min(h, tau - t)
+        rejected = False
+        while True:
+            # Runge-Kutta stages
+            for s in range(1, 6):
+                dy = np.zeros(n)
+                for j in range(s):
+                    dy += _DP_A[s, j] * K[j]
+                K[s] = _snar_kinetics(y + h * dy, k, C_i)
+            dy = np.zeros(n)
+            for j in range(6):
+                dy += _DP_B[j] * K[j]
+            y_new = y + h * dy
+            K[6] = _snar_kinetics(y_new, k, C_i)
+
+            # Error estimate and step size control
+            err = np.zeros(n)
+            for j in range(7):
+                err += _DP_E[j] * K[j]
+            scale = atol + np.maximum(np.abs(y), np.abs(y_new)) * rtol
+            error_norm = _rms(h * err / scale)
+            if error_norm < 1:
+                if error_norm == 0:
+                    factor = 10.0
+                else:
+                    factor = min(10.0, 0.9 * error_norm ** (-1 / 5))
+                if rejected:
+                    factor = min(1.0, factor)
+                break
+            h *= max(0.2, 0.9 * error_norm ** (-1 / 5))
+            rejected = True
+
+        t += h
+        y = y_new
+        K[0] = K[6]
+        h *= factor
+
+    return y
+
+
+@njit(parallel=True, cache=True)
+def _integrate_snar_batch(C_i, T, tau):
+    """Integrate the SnAr kinetic model for several conditions in parallel
+
+    Row i of `C_i` holds the initial concentrations for temperature `T[i]`
+    and residence time `tau[i]`. Returns the outlet concentrations row by row.
+    """
+    C_final = np.zeros_like(C_i)
+    for i in prange(C_i.shape[0]):
+        C_final[i] = _integrate_snar(C_i[i], T[i], tau[i])
+    return C_final
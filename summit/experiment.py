@@ -40,7 +40,8 @@ class Experiment(ABC):
     -----
 
     Developers that subclass `Experiment` need to implement
-    `_run`, which runs the experiments.
+    `_run`, which runs the experiments. `_run_batch` can be
+    overridden to run a whole batch of experiments at once.
 
     """
 
@@ -83,18 +84,28 @@ class Experiment(ABC):
             diff = 0
 
         # Run experiments
-        # TODO: Add an option to run these in parallel
-        for i, condition in conditions.iterrows():
-            start = time.time()
-            res, extras = self._run(condition, **kwargs)
-            experiment_time = time.time() - start
-            res = DataSet(res).T
-            self._data = pd.concat([self._data, res], axis=0)
-            self._data["experiment_t"].iat[-1] = float(experiment_time)
-            self._data["computation_t"].iat[-1] = float(diff)
-            if condition.get("strategy") is not None:
-                self._data["strategy"].iat[-1] = condition.get("strategy").values[0]
-            self.extras.append(extras)
+        results, extras, experiment_times = self._run_batch(conditions, **kwargs)
+        results = [DataSet(res).T for res in results]
+        self.extras.extend(extras)
+        strategy = conditions.get("strategy")
+        if strategy is not None:
+            strategies = strategy.tolist()
+        else:
+            strategies = [None] * len(results)
+
+        # Append the whole batch at once instead of copying the data for every row
+        if len(results) > 0:
+            n = len(results)
+            self._data = pd.concat([self._data] + results, axis=0)
+            columns = self._data.columns
+            experiment_t_loc = columns.get_loc(("experiment_t", "METADATA"))
+            computation_t_loc = columns.get_loc(("computation_t", "METADATA"))
+            strategy_loc = columns.get_loc(("strategy", "METADATA"))
+            self._data.iloc[-n:, experiment_t_loc] = experiment_times
+            self._data.iloc[-n:, computation_t_loc] = float(diff)
+            for j, strategy in enumerate(strategies):
+                if strategy is not None:
+                    self._data.iloc[j - n, strategy_loc] = strategy
         self.prev_itr_time = time.time()
         return self._data.iloc[-len(conditions) :]
 
@@ -119,6 +130,34 @@ class Experiment(ABC):
 
         raise NotImplementedError("_run be implemented by subclasses of Experiment")
 
+    def _run_batch(self, conditions, **kwargs):
+        """Run a batch of experiments
+
+        By default, `_run` is called for each row of `conditions`. Subclasses
+        can override this to run the whole batch at once.
+
+        Arguments
+        ---------
+        conditions: summit.utils.dataset.Dataset
+            A dataset with columns matching the variables in the domain
+            of the experiments to run.
+
+        Returns
+        -------
+        results, extras, experiment_times
+            Lists with the result, extras and run time of each row of
+            `conditions` in the same order (see `_run`).
+        """
+        # TODO: Add an option to run these in parallel
+        results, extras, experiment_times = [], [], []
+        for i, condition in conditions.iterrows():
+            start = time.time()
+            res, extra = self._run(condition, **kwargs)
+            experiment_times.append(float(time.time() - start))
+            results.append(res)
+            extras.append(extra)
+        return results, extras, experiment_times
+
     def reset(self):
         """Reset the experiment
 
@@ -5,15 +5,19 @@ from summit.utils.multiobjective import pareto_efficient, hypervolume
 from summit import get_summit_config_path
 
 from fastprogress.fastprogress import progress_bar
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
+import numba
+import torch
 import os
 import pathlib
+import tempfile
 import uuid
 import json
 import logging
 import pkg_resources
 
-__all__ = ["experiment_from_dict", "Runner", "NeptuneRunner"]
+__all__ = ["experiment_from_dict", "Runner", "NeptuneRunner", "run_repeats"]
 
 
 def experiment_from_dict(d):
@@ -131,9 +135,11 @@ class Runner:
             Previous results to initialize the optimization
         save_freq : int, optional
             The frequency with which to checkpoint the state of the optimization. Defaults to None.
+            Checkpoints overwrite a single `checkpoint_<uuid>.json` in `save_dir` (one per run),
+            which always holds the latest state (including all experiments run so far).
         save_at_end : bool, optional
             Save the state of the optimization at the end of a run, even if it is stopped early.
-            Default is False.
+            The state is written to the same checkpoint file as with `save_freq`. Default is False.
         save_dir : str, optional
             The directory to save checkpoints locally. Defaults to not saving locally.
         """
@@ -148,7 +154,8 @@ class Runner:
         if save_dir is not None and not os.path.isdir(save_dir):
             save_dir = pathlib.Path(save_dir) / "runner" / str(self.uuid_val)
             os.makedirs(save_dir)
-        
+        if save_dir is not None:
+            save_dir = pathlib.Path(save_dir)
 
         n_objs = len(self.experiment.domain.output_variables)
         fbest_old = np.zeros(n_objs)
@@ -180,10 +187,8 @@ class Runner:
                     fbest[j] = self.experiment.data[v.name].min()
 
             # Save state
-            if save_freq is not None:
-                file = save_dir / f"iteration_{i}.json"
-                if i % save_freq == 0:
-                    self.save(file)
+            if save_freq is not None and i % save_freq == 0:
+                self.save(save_dir / f"checkpoint_{self.uuid_val}.json")
 
             compare = np.abs(fbest - fbest_old) > self.f_tol
             if all(compare) or i <= 1:
@@ -205,8 +210,7 @@ class Runner:
 
         # Save at end
         if save_at_end:
-            file = save_dir / f"iteration_{i}.json"
-            self.save(file)
+            self.save(save_dir / f"checkpoint_{self.uuid_val}.json")
 
     def reset(self):
         self.strategy.reset()
@@ -236,8 +240,25 @@ class Runner:
         return cls(strategy=strategy, experiment=experiment, **d["runner"])
 
     def save(self, filename):
-        with open(filename, "w") as f:
-            json.dump(self.to_dict(), f)
+        # Write to a unique temporary file first so an interrupted save
+        # never leaves a truncated checkpoint behind and concurrent
+        # runners saving into the same directory do not collide
+        filename = pathlib.Path(filename)
+        fd, tmp_filename = tempfile.mkstemp(
+            dir=filename.parent, prefix=filename.name, suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(self.to_dict(), f)
+            # mkstemp only lets the owner read the file, so apply the umask
+            # like open would
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_filename, 0o666 & ~umask)
+            os.replace(tmp_filename, filename)
+        except BaseException:
+            os.remove(tmp_filename)
+            raise
 
     @classmethod
     def load(cls, filename):
@@ -327,9 +348,11 @@ class NeptuneRunner(Runner):
         ----------
         save_freq : int, optional
             The frequency with which to checkpoint the state of the optimization. Defaults to None.
+            Checkpoints overwrite a single `checkpoint_<uuid>.json` in `save_dir` (one per run),
+            which always holds the latest state (including all experiments run so far).
         save_at_end : bool, optional
             Save the state of the optimization at the end of a run, even if it is stopped early.
-            Default is False.
+            The state is written to the same checkpoint file as with `save_freq`. Default is False.
         save_dir : str, optional
             The directory to save checkpoints locally. Defaults to `~/.summit/runner`.
         """
@@ -352,7 +375,8 @@ class NeptuneRunner(Runner):
         if save_dir is not None and not os.path.isdir(save_dir):
             save_dir = pathlib.Path(save_dir) / "runner" / str(self.uuid_val)
             os.makedirs(save_dir)
-        
+        if save_dir is not None:
+            save_dir = pathlib.Path(save_dir)
 
         # Create neptune experiment
         from neptune.sessions import Session, HostedNeptuneBackend
@@ -409,13 +433,10 @@ class NeptuneRunner(Runner):
                 neptune_exp.send_metric("hypervolume", hv)
 
             # Save state
-            if save_freq is not None:
-                file = save_dir / f"iteration_{i}.json"
-                if i % save_freq == 0:
-                    self.save(file)
-                    neptune_exp.send_artifact(str(file))
-                if not save_dir:
-                    os.remove(file)
+            if save_freq is not None and i % save_freq == 0:
+                file = save_dir / f"checkpoint_{self.uuid_val}.json"
+                self.save(file)
+                neptune_exp.send_artifact(str(file))
 
             # Stop if no improvement
             compare = np.abs(fbest - fbest_old) > self.f_tol
@@ -438,7 +459,7 @@ class NeptuneRunner(Runner):
 
         # Save at end
         if save_at_end:
-            file = save_dir / f"iteration_{i}.json"
+            file = save_dir / f"checkpoint_{self.uuid_val}.json"
             self.save(file)
             neptune_exp.send_artifact(str(file))
             if not save_dir:
@@ -462,3 +483,85 @@ class NeptuneRunner(Runner):
             )
         )
         return d
+
+
+# Runner reused by all repeats that are run in a worker process
+_worker_runner = None
+
+
+def _init_worker(runner_factory, num_threads):
+    global _worker_runner
+    # Share the cores between the worker processes
+    numba.set_num_threads(num_threads)
+    _worker_runner = runner_factory()
+
+
+def _run_repeat(seed, run_kwargs):
+    np.random.seed(seed)
+    torch.manual_seed(seed)
+    _worker_runner.reset()
+    _worker_runner.run(**run_kwargs)
+    return _worker_runner
+
+
+def run_repeats(runner_factory, num_repeats, n_jobs=None, **kwargs):
+    """Run independent repeats of a closed-loop optimization in parallel
+
+    Parameters
+    ----------
+    runner_factory : callable
+        A function with no arguments that returns a new :class:`Runner`.
+        It must be picklable (i.e., defined at the top level of a module).
+    num_repeats : int
+        The number of repeats to run.
+    n_jobs : int, optional
+        The number of worker processes. Defaults to the number of processors.
+        No more workers than repeats are started.
+    **kwargs
+        Passed to :meth:`Runner.run` in each repeat. The progress bar is
+        turned off unless specified.
+
+    Returns
+    -------
+    runners : list of :class:`Runner`
+        The finished runners in the order of the repeats.
+
+    Notes
+    -----
+    The runner is only built once in each worker process and reset with
+    :meth:`Runner.reset` before every repeat. This avoids rebuilding expensive
+    experiments (e.g., loading pretrained emulators) and strategies for every
+    repeat, so their `reset` methods must clear all state from previous runs.
+
+    Repeats are not reproducible. Each repeat reseeds the global numpy and
+    torch random states with fresh entropy, so that worker processes do not
+    share the random state inherited from the parent process. However,
+    strategies and experiments such as :class:`~summit.strategies.Random`
+    or :class:`~summit.benchmarks.SnarBenchmark` draw their own random states
+    when they are built.
+
+    The threads used by numba's parallel kernels (e.g., in
+    :class:`~summit.benchmarks.SnarBenchmark`) are split evenly between the
+    worker processes so that the repeats do not oversubscribe the cores.
+
+    Examples
+    --------
+    >>> from summit import *
+    >>> def make_runner():
+    ...     benchmark = SnarBenchmark()
+    ...     strategy = Random(benchmark.domain)
+    ...     return Runner(strategy=strategy, experiment=benchmark, max_iterations=10)
+    >>> runners = run_repeats(make_runner, num_repeats=4)  # doctest: +SKIP
+
+    """
+    kwargs.setdefault("progress_bar", False)
+    seeds = np.random.SeedSequence().generate_state(num_repeats)
+    n_workers = max(1, min(n_jobs or os.cpu_count() or 1, num_repeats))
+    num_threads = max(1, numba.config.NUMBA_NUM_THREADS // n_workers)
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=_init_worker,
+        initargs=(runner_factory, num_threads),
+    ) as executor:
+        futures = [executor.submit(_run_repeat, int(seed), kwargs) for seed in seeds]
+        return [f.result() for f in futures]
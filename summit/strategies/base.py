@@ -121,9 +121,13 @@ class Transform:
                     new_ds.columns.set_codes(column_codes_2, level=1, inplace=True)
                 else:
                     indices = new_ds[variable.name].values
-                    descriptors = variable.ds.loc[indices]
-                    descriptors.index = new_ds.index
-                    new_ds = new_ds.join(descriptors, how="inner")
+                    descriptors = variable.ds.loc[indices].reset_index(drop=True)
+                    # Rows already line up, so concatenate by position instead of joining
+                    index = new_ds.index
+                    new_ds = pd.concat(
+                        [new_ds.reset_index(drop=True), descriptors], axis=1
+                    )
+                    new_ds.index = index
 
                 # Make the original descriptors column a metadata column
                 column_list_1 = new_ds.columns.levels[0].to_list()
@@ -278,34 +282,25 @@ class Transform:
                             new_ds[descriptor] * (var_max - var_min) + var_min
                         )
 
-                var_descriptor_conditions = new_ds[var_descriptor_names]
-                var_descriptor_orig_data = np.asarray(
-                    [
-                        variable.ds.loc[[level], :].values[0].tolist()
-                        for level in variable.ds.index
-                    ]
+                var_descriptor_conditions = new_ds[var_descriptor_names].to_numpy(
+                    dtype=np.float64
+                )
+                var_descriptor_orig_data = np.ascontiguousarray(
+                    variable.ds[var_descriptor_names].to_numpy(dtype=np.float64)
                 )
-                var_categorical_transformed = []
                 # Find the closest points by euclidean distance
-                for _, dc in var_descriptor_conditions.iterrows():
-                    # Euclidean distance calculation
-                    eucl_distance_squ = np.sum(
-                        np.square(
-                            np.subtract(
-                                var_descriptor_orig_data,
-                                dc.to_numpy(),
-                            )
-                        ),
-                        axis=1,
-                    )
-                    # Choose closest point
-                    cat_level_index = np.where(
-                        eucl_distance_squ == np.min(eucl_distance_squ)
-                    )[0][0]
-                    # Find the matching name of the categorical variable
-                    cat_level = variable.ds.index[cat_level_index]
-                    # Add the original categorical variables name to the dataset
-                    var_categorical_transformed.append(cat_level)
+                eucl_distance_squ = np.sum(
+                    np.square(
+                        var_descriptor_conditions[:, np.newaxis, :]
+                        - var_descriptor_orig_data[np.newaxis, :, :]
+                    ),
+                    axis=2,
+                )
+                # Choose closest point and find the matching name of the categorical variable
+                cat_level_indices = np.argmin(eucl_distance_squ, axis=1)
+                var_categorical_transformed = variable.ds.index[
+                    cat_level_indices
+                ].tolist()
                 new_ds.insert(
                     loc=i, column=variable.name, value=var_categorical_transformed
                 )
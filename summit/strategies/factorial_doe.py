@@ -105,22 +105,10 @@ def fullfact(levels):
 
     Notes
     ------
-    This code is copied from pydoe2: https://github.com/clicumu/pyDOE2/blob/master/pyDOE2/doe_factorial.py
+    This is a vectorized version of the design in pydoe2: https://github.com/clicumu/pyDOE2/blob/master/pyDOE2/doe_factorial.py
 
     """
     n = len(levels)  # number of factors
-    nb_lines = np.prod(levels)  # number of trial conditions
-    H = np.zeros((nb_lines, n))
-
-    level_repeat = 1
-    range_repeat = np.prod(levels)
-    for i in range(n):
-        range_repeat //= levels[i]
-        lvl = []
-        for j in range(levels[i]):
-            lvl += [j] * level_repeat
-        rng = lvl * range_repeat
-        level_repeat *= levels[i]
-        H[:, i] = rng
-
-    return H
+    # The first factor varies fastest, so build the grid with the factors reversed
+    H = np.indices(levels[::-1]).reshape(n, -1)[::-1].T
+    return H.astype(float)
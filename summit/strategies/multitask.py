@@ -200,16 +200,28 @@ class MTBO(Strategy):
                 objective.name
             ]
             maximize = False
-        ei = CategoricalEI(self.domain, model, best_f=fbest_scaled, maximize=maximize)
-
-        # Optimize acquisition function
-        results, _ = optimize_acqf(
-            acq_function=ei,
-            bounds=self._get_bounds(),
-            num_restarts=20,
-            q=num_experiments,
-            raw_samples=100,
-        )
+        if _is_enumerable(self.domain, self.categorical_method):
+            # Score every combination of categorical levels directly
+            results = _select_from_library(
+                model,
+                self.domain,
+                best_f=fbest_scaled,
+                maximize=maximize,
+                num_experiments=num_experiments,
+            )
+        else:
+            ei = CategoricalEI(
+                self.domain, model, best_f=fbest_scaled, maximize=maximize
+            )
+
+            # Optimize acquisition function
+            results, _ = optimize_acqf(
+                acq_function=ei,
+                bounds=self._get_bounds(),
+                num_restarts=20,
+                q=num_experiments,
+                raw_samples=100,
+            )
 
         # Convert result to datset
         result = DataSet(
@@ -320,6 +332,77 @@ class CategoricalEI(EI):
         return X
 
 
+def _is_enumerable(domain: Domain, categorical_method: str):
+    """Whether the design space is a finite library of one-hot encoded levels"""
+    return categorical_method == "one-hot" and all(
+        isinstance(v, CategoricalVariable) for v in domain.input_variables
+    )
+
+
+def _one_hot_library(domain: Domain):
+    """One-hot encode all combinations of the categorical variables
+
+    The columns are in the same order as the one-hot encoding of
+    :meth:`~summit.strategies.base.Transform.transform_inputs_outputs`.
+
+    """
+    combos = domain.get_categorical_combinations()
+    blocks = []
+    for v in domain.input_variables:
+        level_index = {l: i for i, l in enumerate(v.levels)}
+        indices = [level_index[l] for l in combos[v.name]]
+        blocks.append(np.eye(len(v.levels))[indices])
+    return np.concatenate(blocks, axis=1)
+
+
+def _select_from_library(model, domain: Domain, best_f, maximize, num_experiments):
+    """Select a batch from all categorical combinations using the Kriging believer
+
+    Expected improvement is evaluated for the whole library in one batched
+    call. After each pick, the model is conditioned on its own posterior mean
+    at the selected point, so the next pick accounts for the pending experiment.
+
+    Parameters
+    ----------
+    model : botorch.models.model.Model
+        A fitted GP. For a multitask GP, only a single experiment can be
+        selected since pending picks are not conditioned on a task.
+    domain : :class:`~summit.domain.Domain`
+        A domain where all input variables are categorical.
+    best_f : float
+        The best (scaled) objective value observed so far.
+    maximize : bool
+        Whether the objective is maximized.
+    num_experiments : int
+        The number of experiments to select.
+
+    Returns
+    -------
+    X : torch.Tensor
+        A `num_experiments x d` tensor of one-hot encoded experiments.
+
+    """
+    X = torch.tensor(_one_hot_library(domain)).double()
+    num_experiments = min(num_experiments, X.shape[0])
+    selected = []
+    for i in range(num_experiments):
+        ei = EI(model, best_f=best_f, maximize=maximize)
+        with torch.no_grad():
+            acq_values = ei(X.unsqueeze(1))
+        acq_values[selected] = -np.inf
+        best = int(acq_values.argmax())
+        selected.append(best)
+
+        # Hallucinate the posterior mean as the outcome of the pick
+        if i < num_experiments - 1:
+            x = X[best : best + 1]
+            with torch.no_grad():
+                y = model.posterior(x).mean.reshape(1, 1)
+            model = model.condition_on_observations(x, y)
+            best_f = max(best_f, float(y)) if maximize else min(best_f, float(y))
+    return X[selected]
+
+
 class STBO(Strategy):
     """Multitask Bayesian Optimisation
 
@@ -435,16 +518,28 @@ class STBO(Strategy):
         else:
             fbest_scaled = output.min()[objective.name]
             maximize = False
-        ei = CategoricalEI(self.domain, model, best_f=fbest_scaled, maximize=maximize)
-
-        # Optimize acquisition function
-        results, acq_values = optimize_acqf(
-            acq_function=ei,
-            bounds=self._get_bounds(),
-            num_restarts=20,
-            q=num_experiments,
-            raw_samples=100,
-        )
+        if _is_enumerable(self.domain, self.categorical_method):
+            # Score every combination of categorical levels directly
+            results = _select_from_library(
+                model,
+                self.domain,
+                best_f=fbest_scaled,
+                maximize=maximize,
+                num_experiments=num_experiments,
+            )
+        else:
+            ei = CategoricalEI(
+                self.domain, model, best_f=fbest_scaled, maximize=maximize
+            )
+
+            # Optimize acquisition function
+            results, acq_values = optimize_acqf(
+                acq_function=ei,
+                bounds=self._get_bounds(),
+                num_restarts=20,
+                q=num_experiments,
+                raw_samples=100,
+            )
 
         # Convert result to datset
         result = DataSet(
@@ -431,11 +431,9 @@ def _lhsclassic(n, samples, random_state):
 
     # Fill points uniformly in each interval
     u = random_state.rand(samples, n)
-    a = cut[:samples]
-    b = cut[1 : samples + 1]
-    rdpoints = np.zeros_like(u)
-    for j in range(n):
-        rdpoints[:, j] = u[:, j] * (b - a) + a
+    a = cut[:samples, np.newaxis]
+    b = cut[1 : samples + 1, np.newaxis]
+    rdpoints = u * (b - a) + a
 
     # Make the random pairings
     H = np.zeros_like(rdpoints)
@@ -453,14 +451,15 @@ def _lhscentered(n, samples, random_state):
     # Generate the intervals
     cut = np.linspace(0, 1, samples + 1)
 
-    # Fill points uniformly in each interval
-    u = random_state.rand(samples, n)
+    # The uniform points are unused, but drawing them keeps seeded designs
+    # reproducible
+    random_state.rand(samples, n)
     a = cut[:samples]
     b = cut[1 : samples + 1]
     _center = (a + b) / 2
 
     # Make the random pairings
-    H = np.zeros_like(u)
+    H = np.empty((samples, n))
     for j in range(n):
         H[:, j] = random_state.permutation(_center)
 
@@ -536,8 +535,5 @@ def _pdist(x):
     if m < 2:
         return []
 
-    d = []
-    for i in range(m - 1):
-        for j in range(i + 1, m):
-            d.append((sum((x[j, :] - x[i, :]) ** 2)) ** 0.5)
-    return np.array(d)
+    i, j = np.triu_indices(m, k=1)
+    return np.sqrt(np.sum((x[j, :] - x[i, :]) ** 2, axis=1))
@@ -296,14 +296,13 @@ class SNOBFIT(Strategy):
                 if v.is_objective and v.maximize:
                     outputs[v.name] = -1 * outputs[v.name]
 
-            x0 = inputs.data_to_numpy().astype(float)
-            y0 = outputs.data_to_numpy().astype(float)
+            x0 = inputs.data_to_numpy().astype(float, copy=False)
+            y0 = outputs.data_to_numpy().astype(float, copy=False)
 
             # Add uncertainties to measurements TODO: include uncertainties in input
-            y = []
-            for i in range(y0.shape[0]):
-                y.append([y0[i].tolist()[0], math.sqrt(numpy.spacing(1))])
-            y0 = numpy.asarray(y, dtype=float)
+            y0 = numpy.column_stack(
+                [y0[:, 0], numpy.full(y0.shape[0], math.sqrt(numpy.spacing(1)))]
+            )
         # If no prev_res are given but prev_param -> raise error
         elif prev_param is not None:
             raise ValueError(
@@ -447,7 +447,9 @@ class SOBO(Strategy):
         if not reference_categories:
             return [i for i, _ in enumerate(categories)]
         else:
-            return [reference_categories.index(c) for c in categories]
+            # Hash lookup instead of scanning the levels for every element
+            level_index = {c: i for i, c in enumerate(reference_categories)}
+            return [level_index[c] for c in categories]
 
     def categorical_unwrap(self, gpyopt_level, categories):
         return categories[int(gpyopt_level)]
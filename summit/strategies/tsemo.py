@@ -43,7 +43,7 @@ class TSEMO(Strategy):
         Default is 1500. Note that the Matlab TSEMO version uses 4000
         which will improve accuracy but significantly slow down optimisation speed.
     n_retries : int, optional
-        Number of retries to use for spectral sampling iF the singular value decomposition
+        Number of retries to use for spectral sampling iF the Cholesky decomposition
         fails. Retrying chooses a new Monte Carlo sampling which usually fixes the problem.
         Defualt is 10.
     generations : int, optional
@@ -219,8 +219,8 @@ class TSEMO(Strategy):
             # Evaluate spectral sampled functions
             sample_f = lambda x: np.atleast_2d(models[i].rff(x)).T
             rmse_train_spectral[i] = rmse(
-                sample_f(inputs.to_numpy().astype("float")),
-                outputs[[v.name]].to_numpy().astype("float"),
+                sample_f(inputs.to_numpy(dtype=float)),
+                outputs[[v.name]].to_numpy(dtype=float),
                 mean=self.transform.output_means[v.name],
                 std=self.transform.output_stds[v.name],
             )
@@ -252,9 +252,12 @@ class TSEMO(Strategy):
         # Select points that give maximum hypervolume improvement
         self.hv_imp, indices = self._select_max_hvi(outputs, y, num_experiments)
 
-        # Join to get single dataset with inputs and outputs and get suggestion
-        result = X.join(y)
-        result = result.iloc[indices, :]
+        # Combine inputs and outputs of the suggestions by position, since
+        # the index repeats across categorical combinations in mixed domains
+        X, y = X.iloc[indices, :], y.iloc[indices, :]
+        index = X.index
+        result = pd.concat([X.reset_index(drop=True), y.reset_index(drop=True)], axis=1)
+        result.index = index
 
         # Do any necessary transformations back
         result = self.transform.un_transform(
@@ -292,8 +295,8 @@ class TSEMO(Strategy):
             problem, optimizer, termination, seed=1, verbose=False
         )
 
-        X = np.atleast_2d(self.internal_res.X).tolist()
-        y = np.atleast_2d(self.internal_res.F).tolist()
+        X = np.atleast_2d(self.internal_res.X)
+        y = np.atleast_2d(self.internal_res.F)
         X = DataSet(X, columns=problem.X_columns)
         y = DataSet(y, columns=[v.name for v in self.domain.output_variables])
         return X, y
@@ -324,8 +327,8 @@ class TSEMO(Strategy):
                 problem, optimizer, termination, seed=1, verbose=False
             )
 
-            X = np.atleast_2d(self.internal_res.X).tolist()
-            y = np.atleast_2d(self.internal_res.F).tolist()
+            X = np.atleast_2d(self.internal_res.X)
+            y = np.atleast_2d(self.internal_res.F)
             X = DataSet(X, columns=problem.X_columns)
             y = DataSet(y, columns=[v.name for v in self.domain.output_variables])
             # Add in categorical variables
@@ -499,6 +502,74 @@ def rmse(Y_pred, Y_true, mean, std):
     return np.sqrt(np.mean(square_error))
 
 
+def sample_rff(lengthscales, scaling, noise, kernel_nu, X, Y, M):
+    """Sample a random Fourier feature approximation of a GP posterior
+
+    Takes the same arguments as `pyrff.sample_rff`. Instead of inverting and
+    decomposing the M x M posterior covariance of the feature weights, the
+    N x N matrix of the training data is factorised once and used to draw the
+    weights with Matheron's rule. This is much cheaper because the number of
+    training points N is far smaller than the number of spectral points M.
+    The training features are evaluated in single precision.
+
+    Returns
+    -------
+    rff : :class:`pyrff.rff.RffApproximation`
+        A deterministic function sampled from the GP posterior
+
+    """
+    from pyrff.exceptions import ShapeError
+    from pyrff.rff import RffApproximation
+    from scipy.linalg import cho_factor, cho_solve
+    from scipy.stats import t
+
+    # Same input checks as pyrff
+    X = np.atleast_2d(X)
+    Y = np.atleast_1d(Y)
+    N, D = len(Y), X.shape[1]
+    lengthscales = np.atleast_1d(lengthscales)
+    if not X.shape == (N, D):
+        raise ShapeError(
+            "Shapes of X and Y do not match.",
+            expected="(?, D), (?,)",
+            actual=f"{X.shape}, {Y.shape}",
+        )
+    if not lengthscales.shape == (D,):
+        raise ShapeError(
+            "Lengthscales and data dimensions do not match.", lengthscales.shape, (D,)
+        )
+    if not np.ndim(scaling) == 0:
+        raise ShapeError('Argument "scaling" must be a scalar.')
+    if not np.ndim(noise) == 0:
+        raise ShapeError('Argument "noise" must be a scalar.')
+    if not isinstance(kernel_nu, (int, float)) or kernel_nu <= 0:
+        raise ValueError('Argument "kernel_nu" must be a positive-definite scalar.')
+
+    # Sample spectral points (Bradford et al., equations 27 and 28)
+    if np.isinf(kernel_nu):
+        W = np.random.normal(loc=0, scale=1 / lengthscales, size=(M, D))
+    else:
+        W = t.rvs(loc=0, scale=1 / lengthscales, df=kernel_nu, size=(M, D))
+    B = np.random.uniform(0, 2 * np.pi, size=(M, 1))
+    sqrt_2_alpha_over_m = np.sqrt(2 * scaling ** 2 / M)
+
+    # The features and their Gram matrix are computed in single precision.
+    # The rounding errors (~1e-6) are far below the smallest noise botorch
+    # infers (1e-4), so the Cholesky factorisation stays well conditioned.
+    phase = np.dot(W.astype(np.float32), X.T.astype(np.float32)) + B.astype(np.float32)
+    zeta = np.float32(sqrt_2_alpha_over_m) * np.cos(phase)
+
+    # Sample the weights from their posterior via a prior sample and an update
+    theta_prior = np.random.normal(size=M)
+    epsilon = np.random.normal(scale=np.sqrt(noise), size=N)
+    K = np.dot(zeta.T, zeta).astype(np.float64) + noise * np.eye(N)
+    L = cho_factor(K, lower=True)
+    residual = Y - np.dot(zeta.T, theta_prior) - epsilon
+    sample_of_theta = theta_prior + np.dot(zeta, cho_solve(L, residual))
+
+    return RffApproximation(sqrt_2_alpha_over_m, W, B, sample_of_theta)
+
+
 class ThompsonSampledModel:
     def __init__(self, model_name=None):
         self.model_name = model_name
@@ -513,14 +584,13 @@ class ThompsonSampledModel:
         from gpytorch.mlls.exact_marginal_log_likelihood import (
             ExactMarginalLogLikelihood,
         )
-        import pyrff
         import torch
 
         self.input_columns_ordered = X.columns
 
         # Convert to tensors
-        X_np = X.to_numpy().astype(float)
-        y_np = y.to_numpy().astype(float)
+        X_np = X.to_numpy(dtype=float)
+        y_np = y.to_numpy(dtype=float)
         X = torch.from_numpy(X_np)
         y = torch.from_numpy(y_np)
 
@@ -551,7 +621,7 @@ class ThompsonSampledModel:
         nu = self.model.covar_module.base_kernel.nu
         for _ in range(n_retries):
             try:
-                self.rff = pyrff.sample_rff(
+                self.rff = sample_rff(
                     lengthscales=self.lengthscales_,
                     scaling=np.sqrt(self.outputscale_),
                     noise=self.noise_,
@@ -41,6 +41,66 @@ def test_snar_benchmark(noise_level):
     return results
 
 
+def test_snar_benchmark_batch():
+    """Test that running a batch of SnAr experiments matches running them one by one"""
+    b = SnarBenchmark()
+    values = {
+        ("tau", "DATA"): [0.5, 1.5, 2.0],
+        ("equiv_pldn", "DATA"): [1.0, 2.5, 5.0],
+        ("conc_dfnb", "DATA"): [0.1, 0.3, 0.5],
+        ("temperature", "DATA"): [30.0, 75.0, 120.0],
+    }
+    # Rows are matched by position, not by index label
+    conditions = DataSet(values, index=[3, 3, 0])
+    batch_results = b.run_experiments(conditions)
+    assert batch_results.shape[0] == 3
+
+    b_single = SnarBenchmark()
+    for i in range(conditions.shape[0]):
+        single_results, _ = b_single._run(conditions.iloc[i].copy())
+        for name in ["tau", "temperature", "sty", "e_factor"]:
+            assert np.isclose(
+                float(batch_results[name].iloc[i]), float(single_results[name])
+            )
+
+
+@pytest.mark.parametrize(
+    "tau, equiv_pldn, conc_dfnb, temperature",
+    [[0.5, 1.0, 0.1, 30.0], [1.0, 2.5, 0.3, 75.0], [2.0, 5.0, 0.5, 120.0]],
+)
+def test_snar_integration(tau, equiv_pldn, conc_dfnb, temperature):
+    """Test the compiled SnAr integrator against solve_ivp"""
+    from scipy.integrate import solve_ivp
+    from summit.benchmarks.snar import _integrate_snar, _snar_rate
+
+    C_i = np.array([conc_dfnb, equiv_pldn * conc_dfnb, 0, 0, 0])
+    C_final = _integrate_snar(C_i, temperature, tau)
+    res = solve_ivp(_snar_rate, [0, tau], C_i.copy(), args=(temperature, C_i))
+    # Depleted reactants are clipped to zero in the state, not only in the rates
+    assert np.all(C_final >= 0)
+    assert np.allclose(C_final, res.y[:, -1], rtol=1e-6, atol=1e-12)
+
+
+@pytest.mark.parametrize("case", [MIT_case1, MIT_case2, MIT_case5])
+@pytest.mark.parametrize("temperature", [30.0, 90.0])
+def test_mit_closed_form(case, temperature):
+    """Test the analytical MIT kinetics against numerical integration"""
+    from scipy.integrate import solve_ivp
+
+    b = case()
+    conc_cat, t, cat_index = 2e-3, 300.0, 1
+    y, _ = b._integrate_equations(conc_cat, t, cat_index, temperature)
+    res = solve_ivp(
+        b._integrand,
+        [0, t],
+        b.C_i,
+        args=(cat_index, temperature),
+        rtol=1e-10,
+        atol=1e-12,
+    )
+    assert np.isclose(y, res.y[3, -1] / b.C_i[0])
+
+
 def test_train_experimental_emulator():
     model_name = f"reizman_suzuki_case_1"
     domain = ReizmanSuzukiEmulator.setup_domain()
@@ -1,12 +1,14 @@
 import pytest
-from summit import NeptuneRunner, Runner, Strategy, Experiment
+from summit import NeptuneRunner, Runner, Strategy, Experiment, run_repeats
 from summit.strategies import *
 from summit.benchmarks import *
 from summit.domain import *
 from summit.utils.dataset import DataSet
 
 import numpy as np
+import functools
 import os
+import uuid
 
 
 @pytest.mark.parametrize("max_iterations", [1, 10])
@@ -161,3 +163,72 @@ def test_runner_mo_integration(strategy, experiment):
     # r.save("test_save.json")
     # r.load("test_save.json")
     # os.remove("test_save.json")
+
+
+def _make_random_runner():
+    exp = Himmelblau()
+    strategy = Random(exp.domain)
+    return Runner(strategy=strategy, experiment=exp, max_iterations=3)
+
+
+def test_run_repeats():
+    runners = run_repeats(_make_random_runner, num_repeats=3, n_jobs=2)
+    assert len(runners) == 3
+    for r in runners:
+        assert r.experiment.data.shape[0] == 3
+
+    # Repeats should not share random states
+    x = [r.experiment.data["x_1"].to_numpy(dtype=float) for r in runners]
+    assert not np.allclose(x[0], x[1])
+
+
+def _make_counted_runner(directory):
+    # Leave a file behind for every runner that is built
+    (directory / str(uuid.uuid4())).touch()
+    return _make_random_runner()
+
+
+def test_run_repeats_workers(tmp_path):
+    # No more runners are built than there are repeats
+    runners = run_repeats(
+        functools.partial(_make_counted_runner, tmp_path), num_repeats=2, n_jobs=8
+    )
+    assert len(runners) == 2
+    assert 1 <= len(list(tmp_path.iterdir())) <= 2
+
+
+def test_runner_checkpoint(tmp_path):
+    r = _make_random_runner()
+    r.run(save_freq=1, save_at_end=True, save_dir=tmp_path, progress_bar=False)
+
+    # Every checkpoint and the final save overwrite the same file
+    files = [f.name for f in tmp_path.iterdir()]
+    assert files == [f"checkpoint_{r.uuid_val}.json"]
+    r_loaded = Runner.load(tmp_path / files[0])
+    assert r_loaded.experiment.data.shape[0] == 3
+
+
+def test_runner_save_permissions(tmp_path):
+    r = _make_random_runner()
+    r.save(tmp_path / "runner.json")
+
+    # Saved files get the same permissions as files created with open
+    with open(tmp_path / "reference.json", "w") as f:
+        f.write("{}")
+    mode = lambda name: os.stat(tmp_path / name).st_mode & 0o777
+    assert mode("runner.json") == mode("reference.json")
+
+
+def test_runner_checkpoint_shared_dir(tmp_path):
+    # Runners sharing a save directory keep separate checkpoints
+    runners = run_repeats(
+        _make_random_runner, num_repeats=4, n_jobs=2, save_freq=1, save_dir=tmp_path
+    )
+    files = sorted(f.name for f in tmp_path.iterdir())
+    assert files == sorted(f"checkpoint_{r.uuid_val}.json" for r in runners)
+    for r in runners:
+        r_loaded = Runner.load(tmp_path / f"checkpoint_{r.uuid_val}.json")
+        assert np.allclose(
+            r_loaded.experiment.data["x_1"].to_numpy(dtype=float),
+            r.experiment.data["x_1"].to_numpy(dtype=float),
+        )
@@ -243,6 +243,49 @@ def test_logspaceobjectives_transform():
     strategy.suggest_experiments(5, previous_results)
 
 
+def test_descriptors_transform_repeated_index():
+    solvent_ds = DataSet(
+        [[5, 81], [-93, 111], [-95, 69]],
+        index=["benzene", "toluene", "hexane"],
+        columns=["melting_point", "boiling_point"],
+    )
+    domain = Domain()
+    domain += ContinuousVariable(
+        name="temperature",
+        description="reaction temperature in celsius",
+        bounds=[50, 100],
+    )
+    domain += CategoricalVariable(
+        "solvent", "solvent descriptors", descriptors=solvent_ds
+    )
+    domain += ContinuousVariable(
+        name="yield_", description="", bounds=[0, 100], is_objective=True, maximize=True
+    )
+    values = {
+        ("temperature", "DATA"): [60, 70, 80, 90],
+        ("solvent", "DATA"): ["toluene", "benzene", "hexane", "toluene"],
+        ("yield_", "DATA"): [10, 20, 30, 40],
+        ("strategy", "METADATA"): ["Random"] * 4,
+    }
+    # Previous results concatenated without resetting the index
+    previous_results = DataSet(values, index=[0, 1, 0, 1])
+
+    transform = Transform(domain)
+    inputs, outputs = transform.transform_inputs_outputs(
+        previous_results, categorical_method="descriptors"
+    )
+    assert inputs.shape[0] == 4
+    assert outputs.shape[0] == 4
+    assert list(inputs.index) == [0, 1, 0, 1]
+    expected = solvent_ds.loc[values[("solvent", "DATA")]]
+    for name in ["melting_point", "boiling_point"]:
+        assert np.allclose(
+            inputs[name].to_numpy(dtype=float), expected[name].to_numpy(dtype=float)
+        )
+    assert np.allclose(inputs["temperature"].to_numpy(dtype=float), [60, 70, 80, 90])
+    assert np.allclose(outputs["yield_"].to_numpy(dtype=float), [10, 20, 30, 40])
+
+
 @pytest.mark.parametrize("num_experiments", [1, 2, 4])
 @pytest.mark.parametrize("maximize", [True, False])
 @pytest.mark.parametrize("constraints", [False])
@@ -691,6 +734,29 @@ def test_mtbo(
         fig, ax = hartmann3D.plot()
 
 
+def test_stbo_categorical_library():
+    domain = Domain()
+    domain += CategoricalVariable(
+        name="catalyst", description="", levels=["a", "b", "c"]
+    )
+    domain += CategoricalVariable(
+        name="base", description="", levels=["w", "x", "y", "z"]
+    )
+    domain += ContinuousVariable(
+        name="yld", description="", bounds=[0, 100], is_objective=True, maximize=True
+    )
+    strategy = STBO(domain)
+
+    prev_res = domain.get_categorical_combinations().iloc[:4].copy()
+    prev_res["yld", "DATA"] = [10.0, 50.0, 20.0, 30.0]
+    next_experiments = strategy.suggest_experiments(3, prev_res=prev_res)
+
+    # The batch should contain three distinct combinations
+    assert next_experiments.shape[0] == 3
+    combos = set(zip(next_experiments["catalyst"], next_experiments["base"]))
+    assert len(combos) == 3
+
+
 @pytest.mark.parametrize("batch_size", [1, 2, 10])
 def test_tsemo(batch_size, test_num_improve_iter=2, save=False):
     num_inputs = 2
@@ -731,6 +797,119 @@ def test_tsemo(batch_size, test_num_improve_iter=2, save=False):
     # assert hv > 117.0
 
 
+def test_tsemo_mixed_domain_repeated_index():
+    domain = Domain()
+    domain += ContinuousVariable(name="x", description="", bounds=[0, 1])
+    domain += CategoricalVariable(name="cat", description="", levels=["a", "b"])
+    domain += ContinuousVariable(
+        name="y_0", description="", bounds=[0, 2], is_objective=True, maximize=False
+    )
+    domain += ContinuousVariable(
+        name="y_1", description="", bounds=[0, 1], is_objective=True, maximize=False
+    )
+    strategy = TSEMO(
+        domain, generations=10, pop_size=20, n_spectral_points=200, n_retries=1
+    )
+
+    # Previous results concatenated without resetting the index
+    x = np.random.RandomState(0).rand(8)
+    cat = np.array(["a", "b"] * 4)
+    values = {
+        ("x", "DATA"): x,
+        ("cat", "DATA"): cat,
+        ("y_0", "DATA"): x ** 2 + (cat == "b"),
+        ("y_1", "DATA"): (1 - x) ** 2,
+        ("strategy", "METADATA"): ["LHS"] * 8,
+    }
+    prev_res = DataSet(values, index=[0, 1, 2, 3] * 2)
+
+    # Record the NSGA-II candidates and the positions selected from them
+    record = {}
+    nsga_optimize_mixed = strategy._nsga_optimize_mixed
+    select_max_hvi = strategy._select_max_hvi
+
+    def _nsga_optimize_mixed(models):
+        record["X"], record["y"] = nsga_optimize_mixed(models)
+        return record["X"], record["y"]
+
+    def _select_max_hvi(y, samples, num_evals=1):
+        hv_imp, record["indices"] = select_max_hvi(y, samples, num_evals)
+        return hv_imp, record["indices"]
+
+    strategy._nsga_optimize_mixed = _nsga_optimize_mixed
+    strategy._select_max_hvi = _select_max_hvi
+    result = strategy.suggest_experiments(2, prev_res=prev_res)
+
+    # The candidate index repeats for every categorical combination
+    assert not record["X"].index.is_unique
+    indices = record["indices"]
+    assert result.shape[0] == len(indices)
+
+    # Inputs and predicted outputs of each suggestion come from the same candidate
+    X = record["X"].iloc[indices]
+    y = record["y"].iloc[indices]
+    assert np.allclose(result["x"].to_numpy(dtype=float), X["x"].to_numpy(dtype=float))
+    assert list(result["cat"]) == [
+        "a" if a == 1 else "b" for a in X["cat_a"].to_numpy(dtype=float)
+    ]
+    for name in ["y_0", "y_1"]:
+        mean = strategy.transform.output_means[name]
+        std = strategy.transform.output_stds[name]
+        assert np.allclose(
+            result[name].to_numpy(dtype=float),
+            y[name].to_numpy(dtype=float) * std + mean,
+        )
+
+
+@pytest.mark.parametrize("kernel_nu", [np.inf, 2.5])
+def test_tsemo_sample_rff(kernel_nu):
+    import pyrff
+    from summit.strategies.tsemo import sample_rff
+
+    rng = np.random.RandomState(0)
+    X = rng.uniform(size=(10, 2))
+    Y = np.sin(3 * X).sum(axis=1)
+    Y = (Y - Y.mean()) / Y.std()
+    lengthscales, noise, M = np.array([0.3, 0.5]), 1e-3, 300
+
+    np.random.seed(1)
+    rff = sample_rff(lengthscales, 1.0, noise, kernel_nu, X, Y, M)
+    np.random.seed(1)
+    rff_pyrff = pyrff.sample_rff(lengthscales, 1.0, noise, kernel_nu, X, Y, M)
+
+    # Same spectral points as pyrff for the same seed
+    assert np.allclose(rff.W, rff_pyrff.W)
+    assert np.allclose(rff.B, rff_pyrff.B)
+
+    # Closed-form posterior of the weights used by pyrff, N(A^-1 zeta Y / noise, A^-1)
+    zeta = rff.sqrt_2_alpha_over_m * np.cos(np.dot(rff.W, X.T) + rff.B)
+    A = np.dot(zeta, zeta.T) / noise + np.eye(M)
+    mean = np.linalg.solve(A, np.dot(zeta, Y)) / noise
+
+    # The whitened deviation of the sampled weights from the mean is standard normal
+    z = np.dot(np.linalg.cholesky(A).T, rff.sample_of_theta - mean)
+    assert abs(z.mean()) < 4 / np.sqrt(M)
+    assert abs(z.std() - 1) < 0.2
+
+    # The sampled function interpolates the training data up to the noise
+    assert np.sqrt(np.mean((rff(X) - Y) ** 2)) < 0.1
+
+
+def test_tsemo_sample_rff_checks():
+    from pyrff.exceptions import ShapeError
+    from summit.strategies.tsemo import sample_rff
+
+    X, Y = np.zeros((5, 2)), np.zeros(5)
+    with pytest.raises(ShapeError):
+        sample_rff(np.ones(2), 1.0, 1e-3, np.inf, X, Y[:4], 10)
+    with pytest.raises(ShapeError):
+        sample_rff(np.ones(3), 1.0, 1e-3, np.inf, X, Y, 10)
+    with pytest.raises(ShapeError):
+        sample_rff(np.ones(2), np.ones(2), 1e-3, np.inf, X, Y, 10)
+    with pytest.raises(ValueError):
+        sample_rff(np.ones(2), 1.0, 1e-3, 0.0, X, Y, 10)
+
+
 @pytest.mark.parametrize(
     "batch_size, max_num_exp, maximize, constraint",
     [[1, 1, True, False], [1, 200, True, False], [4, 200, False, False]],
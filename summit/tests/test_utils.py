@@ -26,3 +26,12 @@ def test_dataset():
     assert all(ds.columns.get_level_values("NAME").tolist()) == all(columns)
     assert all(ds.data_columns) == all(data_columns)
     assert all(ds.metadata_columns) == all(metadata_columns)
+
+    # Metadata columns are excluded from the data array
+    values = ds.data_to_numpy()
+    assert values.shape == (2, 4)
+    assert values.dtype == float
+
+    # Precalculated statistics are used as passed
+    standard = ds.standardize(mean=values.mean(axis=0), std=values.std(axis=0))
+    assert (standard == ds.standardize()).all()
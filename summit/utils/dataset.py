@@ -200,8 +200,7 @@ class DataSet(pd.core.frame.DataFrame):
         This method does not change the internal values of the data columns in place.
 
         """
-        values = self.data_to_numpy()
-        values = values.astype(np.float64)
+        values = self.data_to_numpy().astype(np.float64, copy=False)
         maxes = np.max(values, axis=0)
         mins = np.min(values, axis=0)
         ranges = maxes - mins
@@ -250,11 +249,15 @@ class DataSet(pd.core.frame.DataFrame):
         This method does not change the internal values of the data columns in place.
 
         """
-        values = self.data_to_numpy()
-        values = values.astype(np.float64)
-
-        mean = kwargs.get("mean", np.mean(values, axis=0))
-        sigma = kwargs.get("std", np.std(values, axis=0))
+        values = self.data_to_numpy().astype(np.float64, copy=False)
+
+        # Only compute the statistics that were not passed in
+        mean = kwargs.get("mean")
+        if mean is None:
+            mean = np.mean(values, axis=0)
+        sigma = kwargs.get("std")
+        if sigma is None:
+            sigma = np.std(values, axis=0)
         standard = (values - mean) / sigma
         standard[abs(standard) < small_tol] = 0.0
         if return_mean and return_std:
@@ -301,14 +304,10 @@ class DataSet(pd.core.frame.DataFrame):
 
     def data_to_numpy(self) -> int:
         """Return dataframe with the metadata columns removed"""
-        result = super().to_numpy()
-        metadata_columns = []
-        for i, column in enumerate(self.columns):
-            if column[1] == "METADATA":
-                metadata_columns.append(i)
-        mask = np.ones(len(self.columns), dtype=bool)
-        mask[metadata_columns] = False
-        return result[:, mask]
+        # Select the data columns before converting so that string metadata
+        # does not force the whole array to object dtype
+        mask = self.columns.get_level_values(1) != "METADATA"
+        return pd.DataFrame.to_numpy(self.iloc[:, mask])
 
     @property
     def metadata_columns(self):